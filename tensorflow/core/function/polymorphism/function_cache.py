@@ -42,8 +42,9 @@ class FunctionCache:
   def lookup(self, context: FunctionContext,
              function_type: function_type_lib.FunctionType) -> Optional[Any]:
     """Looks up a concrete function based on the context and type."""
-    if context in self._dispatch_dict:
-      dispatch_type = self._dispatch_dict[context].dispatch(function_type)
+    dispatch_table = self._dispatch_dict.get(context)
+    if dispatch_table is not None:
+      dispatch_type = dispatch_table.dispatch(function_type)
       if dispatch_type:
         return self._primary[(context, dispatch_type)]
 
@@ -15,6 +15,7 @@
 """Represents the types of TF functions."""
 
 import collections
+import functools
 import inspect
 from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
@@ -162,6 +163,9 @@ class FunctionType(inspect.Signature):
                **kwargs):
     super().__init__(parameters, **kwargs)
     self._captures = captures if captures else collections.OrderedDict()
+    # FunctionTypes are immutable and get hashed on every cache lookup, so the
+    # hash is computed once on demand.
+    self._cached_hash = None
 
   @property
   def parameters(self) -> Mapping[str, Any]:
@@ -178,14 +182,8 @@ class FunctionType(inspect.Signature):
                     *,
                     follow_wrapped: bool = True) -> "FunctionType":
     """Generate FunctionType from a python Callable."""
-    signature = super().from_callable(obj, follow_wrapped=follow_wrapped)
-    # TODO(fmuham): Support TraceType-based annotations.
-    parameters = [
-        Parameter(p.name, p.kind, p.default is not p.empty, None)
-        for p in signature.parameters.values()
-    ]
-
-    return FunctionType(parameters)
+    return cls.from_callable_with_default_values(
+        obj, follow_wrapped=follow_wrapped)[0]
 
   @classmethod
   def get_default_values(cls,
@@ -193,12 +191,27 @@ class FunctionType(inspect.Signature):
                          *,
                          follow_wrapped: bool = True) -> Dict[str, Any]:
     """Inspects and returns a dictionary of default values."""
+    return cls.from_callable_with_default_values(
+        obj, follow_wrapped=follow_wrapped)[1]
+
+  @classmethod
+  def from_callable_with_default_values(
+      cls,
+      obj: Callable[..., Any],
+      *,
+      follow_wrapped: bool = True) -> Tuple["FunctionType", Dict[str, Any]]:
+    """Returns FunctionType and default values from a single inspection."""
     signature = super().from_callable(obj, follow_wrapped=follow_wrapped)
+    # TODO(fmuham): Support TraceType-based annotations.
+    parameters = []
     default_values = {}
     for p in signature.parameters.values():
+      parameters.append(
+          Parameter(p.name, p.kind, p.default is not p.empty, None))
       if p.default is not p.empty:
         default_values[p.name] = p.default
-    return default_values
+
+    return FunctionType(parameters), default_values
 
   @classmethod
   def from_proto(cls, proto: Any) -> "FunctionType":
@@ -226,17 +239,15 @@ class FunctionType(inspect.Signature):
     with_default_args = collections.OrderedDict()
     for name, value in bound_arguments.arguments.items():
       if value is CAPTURED_DEFAULT_VALUE:
-        with_default_args[name] = default_values[name]
-      else:
-        with_default_args[name] = value
+        value = default_values[name]
 
-    for arg_name in with_default_args:
-      constraint = self.parameters[arg_name].type_constraint
+      constraint = self.parameters[name].type_constraint
       if constraint:
-        with_default_args[arg_name] = constraint._cast(  # pylint: disable=protected-access
-            with_default_args[arg_name],
+        value = constraint._cast(  # pylint: disable=protected-access
+            value,
             trace_type.InternalCastContext(allow_specs=True),
         )
+      with_default_args[name] = value
     bound_arguments = inspect.BoundArguments(self, with_default_args)
     return bound_arguments
 
@@ -319,7 +330,10 @@ class FunctionType(inspect.Signature):
                                                 other.captures)
 
   def __hash__(self) -> int:
-    return hash((tuple(self.parameters.items()), tuple(self.captures.items())))
+    if self._cached_hash is None:
+      self._cached_hash = hash(
+          (tuple(self.parameters.items()), tuple(self.captures.items())))
+    return self._cached_hash
 
   def __repr__(self):
     return (f"FunctionType(parameters={list(self.parameters.values())!r}, "
@@ -330,6 +344,15 @@ MAX_SANITIZATION_WARNINGS = 5
 sanitization_warnings_given = 0
 
 
+# Keyword names are sanitized on every call with kwargs, and the same few names
+# recur, so the string rewrite is memoized.
+@functools.lru_cache(maxsize=1024)
+def _sanitized_arg_name(name: str) -> str:
+  # Replace non-alphanumeric chars with '_'
+  swapped = "".join([c if c.isalnum() else "_" for c in name])
+  return swapped if swapped[0].isalpha() else "arg_" + swapped
+
+
 # TODO(fmuham): In future, replace warning with exception.
 # TODO(fmuham): Sanitize to graph node conventions.
 def sanitize_arg_name(name: str) -> str:
@@ -347,9 +370,7 @@ def sanitize_arg_name(name: str) -> str:
   Returns:
     A string that meets Python parameter conventions.
   """
-  # Replace non-alphanumeric chars with '_'
-  swapped = "".join([c if c.isalnum() else "_" for c in name])
-  result = swapped if swapped[0].isalpha() else "arg_" + swapped
+  result = _sanitized_arg_name(name)
 
   global sanitization_warnings_given
   if name != result and sanitization_warnings_given < MAX_SANITIZATION_WARNINGS:
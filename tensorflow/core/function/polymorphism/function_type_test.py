@@ -21,7 +21,7 @@ import platform
 from absl.testing import parameterized
 
 from tensorflow.core.function import trace_type
-from tensorflow.core.function.polymorphism import function_type
+from tensorflow.core.function.polymorphism import function_type as function_type_lib
 from tensorflow.core.function.polymorphism import function_type_pb2
 from tensorflow.core.function.trace_type import serialization
 from tensorflow.python.framework import func_graph
@@ -36,40 +36,41 @@ class FunctionTypeTest(test.TestCase):
     def foo(x, y, z):  # pylint: disable=unused-argument
       pass
 
-    constraint = function_type.FunctionType.from_callable(foo)
+    constraint = function_type_lib.FunctionType.from_callable(foo)
     self.assertEqual(
         constraint,
-        function_type.FunctionType(
-            (function_type.Parameter(
-                "x", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+        function_type_lib.FunctionType(
+            (function_type_lib.Parameter(
+                "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                 None),
-             function_type.Parameter(
-                 "y", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+             function_type_lib.Parameter(
+                 "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                  None),
-             function_type.Parameter(
-                 "z", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+             function_type_lib.Parameter(
+                 "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                  None))))
-    self.assertEqual(function_type.FunctionType.get_default_values(foo), {})
+    self.assertEqual(function_type_lib.FunctionType.get_default_values(foo), {})
 
   def test_optional_only(self):
 
     def foo(x=1, y=2, z=3):  # pylint: disable=unused-argument
       pass
 
-    constraint = function_type.FunctionType.from_callable(foo)
+    constraint = function_type_lib.FunctionType.from_callable(foo)
     self.assertEqual(
         constraint,
-        function_type.FunctionType(
-            (function_type.Parameter(
-                "x", function_type.Parameter.POSITIONAL_OR_KEYWORD, True, None),
-             function_type.Parameter(
-                 "y", function_type.Parameter.POSITIONAL_OR_KEYWORD, True,
+        function_type_lib.FunctionType(
+            (function_type_lib.Parameter(
+                "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, True,
+                None),
+             function_type_lib.Parameter(
+                 "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, True,
                  None),
-             function_type.Parameter(
-                 "z", function_type.Parameter.POSITIONAL_OR_KEYWORD, True,
+             function_type_lib.Parameter(
+                 "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, True,
                  None))))
     self.assertEqual(
-        function_type.FunctionType.get_default_values(foo), {
+        function_type_lib.FunctionType.get_default_values(foo), {
             "x": 1,
             "y": 2,
             "z": 3
@@ -80,21 +81,21 @@ class FunctionTypeTest(test.TestCase):
     def foo(x, y, z=3):  # pylint: disable=unused-argument
       pass
 
-    constraint = function_type.FunctionType.from_callable(foo)
+    constraint = function_type_lib.FunctionType.from_callable(foo)
     self.assertEqual(
         constraint,
-        function_type.FunctionType(
-            (function_type.Parameter(
-                "x", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+        function_type_lib.FunctionType(
+            (function_type_lib.Parameter(
+                "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                 None),
-             function_type.Parameter(
-                 "y", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+             function_type_lib.Parameter(
+                 "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                  None),
-             function_type.Parameter(
-                 "z", function_type.Parameter.POSITIONAL_OR_KEYWORD, True,
+             function_type_lib.Parameter(
+                 "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, True,
                  None))))
     self.assertEqual(
-        function_type.FunctionType.get_default_values(foo), {"z": 3})
+        function_type_lib.FunctionType.get_default_values(foo), {"z": 3})
 
   def test_method_bound(self):
 
@@ -103,18 +104,19 @@ class FunctionTypeTest(test.TestCase):
       def foo(self, x, y=1):
         pass
 
-    constraint = function_type.FunctionType.from_callable(MyClass().foo)
+    constraint = function_type_lib.FunctionType.from_callable(MyClass().foo)
     self.assertEqual(
         constraint,
-        function_type.FunctionType(
-            (function_type.Parameter(
-                "x", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+        function_type_lib.FunctionType(
+            (function_type_lib.Parameter(
+                "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                 None),
-             function_type.Parameter(
-                 "y", function_type.Parameter.POSITIONAL_OR_KEYWORD, True,
+             function_type_lib.Parameter(
+                 "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, True,
                  None))))
     self.assertEqual(
-        function_type.FunctionType.get_default_values(MyClass().foo), {"y": 1})
+        function_type_lib.FunctionType.get_default_values(MyClass().foo),
+        {"y": 1})
 
   def test_method_unbound(self):
 
@@ -123,28 +125,40 @@ class FunctionTypeTest(test.TestCase):
       def foo(self, x, y=1):
         pass
 
-    constraint = function_type.FunctionType.from_callable(MyClass.foo)
+    constraint = function_type_lib.FunctionType.from_callable(MyClass.foo)
     self.assertEqual(
         constraint,
-        function_type.FunctionType(
-            (function_type.Parameter(
-                "self", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
-                None),
-             function_type.Parameter(
-                 "x", function_type.Parameter.POSITIONAL_OR_KEYWORD, False,
+        function_type_lib.FunctionType(
+            (function_type_lib.Parameter(
+                "self", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD,
+                False, None),
+             function_type_lib.Parameter(
+                 "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
                  None),
-             function_type.Parameter(
-                 "y", function_type.Parameter.POSITIONAL_OR_KEYWORD, True,
+             function_type_lib.Parameter(
+                 "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, True,
                  None))))
     self.assertEqual(
-        function_type.FunctionType.get_default_values(MyClass.foo), {"y": 1})
+        function_type_lib.FunctionType.get_default_values(MyClass.foo),
+        {"y": 1})
+
+  def test_from_callable_with_default_values(self):
+
+    def foo(x, y, z=3):  # pylint: disable=unused-argument
+      pass
+
+    function_type, default_values = (
+        function_type_lib.FunctionType.from_callable_with_default_values(foo))
+    self.assertEqual(function_type,
+                     function_type_lib.FunctionType.from_callable(foo))
+    self.assertEqual(default_values, {"z": 3})
 
   def test_required_only_validation(self):
 
     def foo(x, y):  # pylint: disable=unused-argument
       pass
 
-    constraint = function_type.FunctionType.from_callable(foo)
+    constraint = function_type_lib.FunctionType.from_callable(foo)
     constraint.bind(*(1, 2))
     constraint.bind(*(), **{"x": 1, "y": 2})
     constraint.bind(*(), **{"y": 1, "x": 2})
@@ -171,7 +185,7 @@ class FunctionTypeTest(test.TestCase):
     def foo(x=1, y=2):  # pylint: disable=unused-argument
       pass
 
-    constraint = function_type.FunctionType.from_callable(foo)
+    constraint = function_type_lib.FunctionType.from_callable(foo)
     constraint.bind(*(1, 2))
     constraint.bind(*(), **{"x": 1, "y": 2})
     constraint.bind(*(1,), **{"y": 2})
@@ -197,7 +211,7 @@ class FunctionTypeTest(test.TestCase):
     def foo(x, y=2):  # pylint: disable=unused-argument
       pass
 
-    constraint = function_type.FunctionType.from_callable(foo)
+    constraint = function_type_lib.FunctionType.from_callable(foo)
     constraint.bind(*(1, 2))
     constraint.bind(*(), **{"x": 1, "y": 2})
     constraint.bind(*(1,), **{"y": 2})
@@ -218,18 +232,20 @@ class FunctionTypeTest(test.TestCase):
       constraint.bind(*(), **{"z": 3})
 
   def test_pickle(self):
-    original = function_type.FunctionType([
-        function_type.Parameter("x",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, None),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, None),
-        function_type.Parameter("z", function_type.Parameter.KEYWORD_ONLY,
-                                False, None)
+    original = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            None),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            None),
+        function_type_lib.Parameter("z",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False, None)
     ])
     cloned = pickle.loads(pickle.dumps(original))
     self.assertEqual(original, cloned)
+    self.assertEqual(hash(original), hash(cloned))
 
 
 class CanonicalizationTest(test.TestCase, parameterized.TestCase):
@@ -250,24 +266,24 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(x, y, z):
       del x, y, z
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
         args, kwargs, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2, 3))
     self.assertEqual(bound_args.kwargs, {})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter(
+            "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -282,24 +298,24 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(x=1, y=2, z=3):
       del x, y, z
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
         args, kwargs, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2, 3))
     self.assertEqual(bound_args.kwargs, {})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter(
+            "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -310,25 +326,25 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(x=1, y=2, z=3):
       del x, y, z
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
-        args, kwargs, function_type.FunctionType.get_default_values(foo), {},
-        polymorphic_type)
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
+        args, kwargs, function_type_lib.FunctionType.get_default_values(foo),
+        {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2, 3))
     self.assertEqual(bound_args.kwargs, {})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter(
+            "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -343,24 +359,24 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(x, y, z=3):
       del x, y, z
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
         args, kwargs, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2, 3))
     self.assertEqual(bound_args.kwargs, {})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter(
+            "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -370,24 +386,27 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(*my_var_args):
       del my_var_args
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
         (1, 2, 3), {}, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2, 3))
     self.assertEqual(bound_args.kwargs, {})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("my_var_args_0",
-                                function_type.Parameter.POSITIONAL_ONLY, False,
-                                trace_type.from_value(1, type_context)),
-        function_type.Parameter("my_var_args_1",
-                                function_type.Parameter.POSITIONAL_ONLY, False,
-                                trace_type.from_value(2, type_context)),
-        function_type.Parameter("my_var_args_2",
-                                function_type.Parameter.POSITIONAL_ONLY, False,
-                                trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("my_var_args_0",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter("my_var_args_1",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter("my_var_args_2",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -397,24 +416,31 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(**kwargs):
       del kwargs
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic((), {
-        "x": 1,
-        "y": 2,
-        "z": 3
-    }, {}, {}, polymorphic_type)
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
+        (), {
+            "x": 1,
+            "y": 2,
+            "z": 3
+        }, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, ())
     self.assertEqual(bound_args.kwargs, {"x": 1, "y": 2, "z": 3})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter("y",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter("z",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -424,24 +450,30 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(*args, **kwargs):
       del args, kwargs
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic((1,), {
-        "y": 2,
-        "z": 3
-    }, {}, {}, polymorphic_type)
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
+        (1,), {
+            "y": 2,
+            "z": 3
+        }, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1,))
     self.assertEqual(bound_args.kwargs, {"y": 2, "z": 3})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("args_0",
-                                function_type.Parameter.POSITIONAL_ONLY, False,
-                                trace_type.from_value(1, type_context)),
-        function_type.Parameter("y", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("args_0",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter("y",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter("z",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -455,23 +487,25 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     def foo(x, y, *, z):
       del x, y, z
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
         args, kwargs, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2))
     self.assertEqual(bound_args.kwargs, {"z": 3})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "x", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter("z",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -488,22 +522,26 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
     # Raises syntax error in 3.7 but is important coverage for 3.8+.
     foo = eval("lambda x, y, /, z: x + y + z")  # pylint: disable=eval-used
 
-    polymorphic_type = function_type.FunctionType.from_callable(foo)
-    bound_args, mono_type, _ = function_type.canonicalize_to_monomorphic(
+    polymorphic_type = function_type_lib.FunctionType.from_callable(foo)
+    bound_args, mono_type, _ = function_type_lib.canonicalize_to_monomorphic(
         args, kwargs, {}, {}, polymorphic_type)
 
     self.assertEqual(bound_args.args, (1, 2, 3))
     self.assertEqual(bound_args.kwargs, {})
 
     type_context = trace_type.InternalTracingContext()
-    expected_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(3, type_context)),
+    expected_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter("y",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter(
+            "z", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(3, type_context)),
     ])
 
     self.assertEqual(mono_type, expected_type)
@@ -512,9 +550,10 @@ class CanonicalizationTest(test.TestCase, parameterized.TestCase):
 class TypeHierarchyTest(test.TestCase):
 
   def test_same_type(self):
-    foo_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(1))
+    foo_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, trace_type.from_value(1))
     ])
     self.assertEqual(foo_type, foo_type)
     self.assertTrue(foo_type.is_supertype_of(foo_type))
@@ -523,13 +562,15 @@ class TypeHierarchyTest(test.TestCase):
         foo_type.most_specific_common_subtype([foo_type, foo_type, foo_type]))
 
   def test_unrelated_types(self):
-    foo_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(1))
+    foo_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, trace_type.from_value(1))
     ])
-    bar_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(2))
+    bar_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, trace_type.from_value(2))
     ])
     self.assertNotEqual(foo_type, bar_type)
     self.assertFalse(foo_type.is_supertype_of(bar_type))
@@ -539,13 +580,15 @@ class TypeHierarchyTest(test.TestCase):
         foo_type.most_specific_common_subtype([bar_type, foo_type]))
 
   def test_partial_raises_error(self):
-    foo_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(1)),
+    foo_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, trace_type.from_value(1)),
     ])
-    bar_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, None)
+    bar_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, None)
     ])
     self.assertNotEqual(foo_type, bar_type)
 
@@ -601,13 +644,15 @@ class TypeHierarchyTest(test.TestCase):
 
     subtype = MockAlwaysSubtype()
 
-    foo_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, supertype),
+    foo_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, supertype),
     ])
-    bar_type = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, subtype)
+    bar_type = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False, subtype)
     ])
 
     self.assertNotEqual(foo_type, bar_type)
@@ -621,14 +666,18 @@ class TypeHierarchyTest(test.TestCase):
 
   def test_placeholder_arg(self):
     type_context = trace_type.InternalTracingContext()
-    foo = function_type.FunctionType([
-        function_type.Parameter("x", function_type.Parameter.POSITIONAL_ONLY,
-                                False, trace_type.from_value(1, type_context)),
-        function_type.Parameter("y",
-                                function_type.Parameter.POSITIONAL_OR_KEYWORD,
-                                False, trace_type.from_value(2, type_context)),
-        function_type.Parameter("z", function_type.Parameter.KEYWORD_ONLY,
-                                False, trace_type.from_value(3, type_context)),
+    foo = function_type_lib.FunctionType([
+        function_type_lib.Parameter("x",
+                                    function_type_lib.Parameter.POSITIONAL_ONLY,
+                                    False,
+                                    trace_type.from_value(1, type_context)),
+        function_type_lib.Parameter(
+            "y", function_type_lib.Parameter.POSITIONAL_OR_KEYWORD, False,
+            trace_type.from_value(2, type_context)),
+        function_type_lib.Parameter("z",
+                                    function_type_lib.Parameter.KEYWORD_ONLY,
+                                    False,
+                                    trace_type.from_value(3, type_context)),
     ])
     context_graph = func_graph.FuncGraph("test")
     placeholder_context = trace_type.InternalPlaceholderContext(context_graph)
@@ -644,7 +693,8 @@ class CapturesTest(test.TestCase):
     super(CapturesTest, self).setUp()
 
     def gen_type_fn(mapping):
-      return function_type.FunctionType([], collections.OrderedDict(mapping))
+      return function_type_lib.FunctionType([],
+                                            collections.OrderedDict(mapping))
 
     self.type_a1_b1 = gen_type_fn({
         "a": trace_type.from_value(1),
@@ -699,20 +749,20 @@ class CapturesTest(test.TestCase):
 class SanitizationTest(test.TestCase):
 
   def testRename(self):
-    self.assertEqual("arg_42", function_type.sanitize_arg_name("42"))
-    self.assertEqual("a42", function_type.sanitize_arg_name("a42"))
-    self.assertEqual("arg__42", function_type.sanitize_arg_name("_42"))
-    self.assertEqual("a___", function_type.sanitize_arg_name("a%$#"))
-    self.assertEqual("arg____", function_type.sanitize_arg_name("%$#"))
-    self.assertEqual("foo", function_type.sanitize_arg_name("foo"))
-    self.assertEqual("Foo", function_type.sanitize_arg_name("Foo"))
+    self.assertEqual("arg_42", function_type_lib.sanitize_arg_name("42"))
+    self.assertEqual("a42", function_type_lib.sanitize_arg_name("a42"))
+    self.assertEqual("arg__42", function_type_lib.sanitize_arg_name("_42"))
+    self.assertEqual("a___", function_type_lib.sanitize_arg_name("a%$#"))
+    self.assertEqual("arg____", function_type_lib.sanitize_arg_name("%$#"))
+    self.assertEqual("foo", function_type_lib.sanitize_arg_name("foo"))
+    self.assertEqual("Foo", function_type_lib.sanitize_arg_name("Foo"))
     self.assertEqual("arg_96ab_cd___53",
-                     function_type.sanitize_arg_name("96ab.cd//?53"))
+                     function_type_lib.sanitize_arg_name("96ab.cd//?53"))
 
   def testLogWarning(self):
 
     with self.assertLogs(level="WARNING") as logs:
-      result = function_type.sanitize_arg_name("96ab.cd//?53")
+      result = function_type_lib.sanitize_arg_name("96ab.cd//?53")
 
     self.assertEqual(result, "arg_96ab_cd___53")
 
@@ -727,27 +777,27 @@ class SerializationTest(test.TestCase, parameterized.TestCase):
   @parameterized.product(
       name=["arg_0", "param"],
       kind=[
-          function_type.Parameter.POSITIONAL_ONLY,
-          function_type.Parameter.POSITIONAL_OR_KEYWORD
+          function_type_lib.Parameter.POSITIONAL_ONLY,
+          function_type_lib.Parameter.POSITIONAL_OR_KEYWORD
       ],
       optional=[True, False],
       type_contraint=[None, trace_type.from_value(1)])
   def testParameter(self, name, kind, optional, type_contraint):
-    original = function_type.Parameter(name, kind, optional, type_contraint)
+    original = function_type_lib.Parameter(name, kind, optional, type_contraint)
     expected_type_constraint = serialization.serialize(
         type_contraint) if type_contraint else None
     expected = function_type_pb2.Parameter(
         name=name,
-        kind=function_type.PY_TO_PROTO_ENUM[kind],
+        kind=function_type_lib.PY_TO_PROTO_ENUM[kind],
         is_optional=optional,
         type_constraint=expected_type_constraint)
     self.assertEqual(original.to_proto(), expected)
-    self.assertEqual(function_type.Parameter.from_proto(expected), original)
+    self.assertEqual(function_type_lib.Parameter.from_proto(expected), original)
 
   def testFunctionType(self):
-    original = function_type.FunctionType([
-        function_type.Parameter("a", function_type.Parameter.POSITIONAL_ONLY,
-                                False, None),
+    original = function_type_lib.FunctionType([
+        function_type_lib.Parameter(
+            "a", function_type_lib.Parameter.POSITIONAL_ONLY, False, None),
     ], collections.OrderedDict([("b", trace_type.from_value(1))]))
     expected = function_type_pb2.FunctionType(
         parameters=[
@@ -763,7 +813,8 @@ class SerializationTest(test.TestCase, parameterized.TestCase):
                     trace_type.from_value(1)))
         ])
     self.assertEqual(original.to_proto(), expected)
-    self.assertEqual(function_type.FunctionType.from_proto(expected), original)
+    self.assertEqual(function_type_lib.FunctionType.from_proto(expected),
+                     original)
 
 
 if __name__ == "__main__":
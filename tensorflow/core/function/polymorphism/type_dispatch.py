@@ -81,11 +81,11 @@ class TypeDispatchTable:
       return request
 
     # For known non-exact matches.
-    # (self._dispatch cache does not contain exact matches)
-    if request in self._dispatch_cache:
+    # (self._dispatch cache does not contain exact matches, nor None targets)
+    result = self._dispatch_cache.get(request)
+    if result is not None:
       # Move to the front of LRU cache.
-      result = self._dispatch_cache.pop(request)
-      self._dispatch_cache[request] = result
+      self._dispatch_cache.move_to_end(request)
       return result
 
     most_specific_supertype = None
@@ -26,9 +26,13 @@ stacks = threading.local()
 
 
 def _control_ctx():
-  if not hasattr(stacks, 'control_status'):
+  # EAFP: on the hot path the stack already exists, so this is a single
+  # thread-local lookup.
+  try:
+    return stacks.control_status
+  except AttributeError:
     stacks.control_status = [_default_control_status_ctx()]
-  return stacks.control_status
+    return stacks.control_status
 
 
 @tf_export('__internal__.autograph.control_status_ctx', v1=[])
@@ -74,8 +78,9 @@ class ControlStatusCtx(object):
         self.__class__.__name__, self.status, self.options)
 
   def __exit__(self, unused_type, unused_value, unused_traceback):
-    assert _control_ctx()[-1] is self
-    _control_ctx().pop()
+    control_ctx = _control_ctx()
+    assert control_ctx[-1] is self
+    control_ctx.pop()
 
 
 class NullCtx(object):
@@ -199,10 +199,9 @@ class FunctionSpec(object):
     """
     _validate_signature(input_signature)
 
-    function_type = function_type_lib.FunctionType.from_callable(
-        python_function)
-    default_values = function_type_lib.FunctionType.get_default_values(
-        python_function)
+    function_type, default_values = (
+        function_type_lib.FunctionType.from_callable_with_default_values(
+            python_function))
 
     is_bound_method = inspect.ismethod(python_function)
 
@@ -273,6 +272,7 @@ class FunctionSpec(object):
     # TODO(edloper): Include name when serializing for SavedModel?
     self._name = name or "f"
     self._input_signature = to_input_signature(function_type)
+    self._flat_input_signature = None
 
   @property
   def default_values(self):
@@ -302,7 +302,10 @@ class FunctionSpec(object):
   # TODO(fmuham): Replace usages with FunctionType and remove.
   @property
   def flat_input_signature(self):
-    return tuple(nest.flatten(self.input_signature, expand_composites=True))
+    if self._flat_input_signature is None:
+      self._flat_input_signature = tuple(
+          nest.flatten(self.input_signature, expand_composites=True))
+    return self._flat_input_signature
 
   @property
   def is_pure(self):
@@ -494,8 +497,10 @@ def cast_numpy_inputs(inputs):
   need_packing = False
   filtered_flat_inputs = []
   for index, value in enumerate(flat_inputs):
-    if isinstance(value,
-                  (ops.Tensor, resource_variable_ops.BaseResourceVariable)):
+    # The exact type check skips the isinstance walk for eager tensors, which
+    # are by far the most common inputs.
+    if type(value) is ops.EagerTensor or isinstance(  # pylint: disable=unidiomatic-typecheck
+        value, (ops.Tensor, resource_variable_ops.BaseResourceVariable)):
       filtered_flat_inputs.append(value)
     elif hasattr(value, "__array__") and not (
         hasattr(value, "_should_act_as_resource_variable") or
@@ -529,7 +534,8 @@ def filter_function_inputs(args, kwargs):
 
   filtered_flat_inputs = [
       t for t in flat_inputs
-      if isinstance(t, (ops.Tensor, resource_variable_ops.BaseResourceVariable))
+      if type(t) is ops.EagerTensor or isinstance(  # pylint: disable=unidiomatic-typecheck
+          t, (ops.Tensor, resource_variable_ops.BaseResourceVariable))
   ]
 
   return filtered_flat_inputs
@@ -1314,6 +1314,8 @@ class ConcreteFunction(core.ConcreteFunction, trackable.Trackable):
     # are assigned after construction.
     self._arg_keywords = None
     self._num_positional_args = None
+    # (kwarg_specs, sanitized kwarg_specs) for the structured signature check.
+    self._sanitized_kwarg_specs = None
 
     self._func_graph = func_graph
     self._captured_inputs = self._func_graph.external_captures + self._func_graph.deferred_external_captures
@@ -1482,6 +1484,10 @@ class ConcreteFunction(core.ConcreteFunction, trackable.Trackable):
       # Construct the list of input tensors: check if the structured signature
       # applies first; and if not, then use the flat signature.
       if self._function_spec is not None:
+        if not args and not kwargs and self._has_empty_structured_signature():
+          # Nothing to bind or type-check, so skip canonicalization.
+          return self._call_flat([], self.captured_inputs,
+                                 cancellation_manager)
         try:
           return self._call_with_structured_signature(args, kwargs,
                                                       cancellation_manager)
@@ -1494,6 +1500,10 @@ class ConcreteFunction(core.ConcreteFunction, trackable.Trackable):
 
       return self._call_with_flat_signature(args, kwargs, cancellation_manager)
 
+  def _has_empty_structured_signature(self):
+    """Returns True if the structured signature takes no arguments at all."""
+    return self._func_graph.structured_input_signature == ((), {})
+
   def _call_with_flat_signature(self, args, kwargs, cancellation_manager):
     """Executes the wrapped function with the flat signature.
 
@@ -1515,7 +1525,6 @@ class ConcreteFunction(core.ConcreteFunction, trackable.Trackable):
           f"{self._flat_signature_summary()} takes {self._num_positional_args} "
           f"positional arguments, got {len(args)}.")
     args = list(args)
-    kwargs = dict(kwargs)
     kwargs = {
         function_type_lib.sanitize_arg_name(k): v for k, v in kwargs.items()
     }
@@ -1612,20 +1621,33 @@ class ConcreteFunction(core.ConcreteFunction, trackable.Trackable):
       name = self._function_spec.arg_names[i]
       self._structured_signature_check_arg_type(arg, spec, name,
                                                 signature_context)
-    kwarg_specs = {
-        function_type_lib.sanitize_arg_name(k): v
-        for k, v in kwarg_specs.items()
-    }
+    kwarg_specs = self._get_sanitized_kwarg_specs(kwarg_specs)
     for (name, arg) in kwargs.items():
       self._structured_signature_check_arg_type(arg, kwarg_specs[name], name,
                                                 signature_context)
 
+  def _get_sanitized_kwarg_specs(self, kwarg_specs):
+    """Returns `kwarg_specs` keyed by sanitized names, built once per dict."""
+    cached = self._sanitized_kwarg_specs
+    if cached is None or cached[0] is not kwarg_specs:
+      cached = (kwarg_specs, {
+          function_type_lib.sanitize_arg_name(k): v
+          for k, v in kwarg_specs.items()
+      })
+      self._sanitized_kwarg_specs = cached
+    return cached[1]
+
   def _structured_signature_check_arg_type(self, arg, spec, name,
                                            signature_context):
     """Raise TypeError if `arg`'s type doesn't match `spec`."""
     if arg is function_spec.BOUND_VALUE:
       return
 
+    # A plain Tensor passed for a TensorSpec is both a matching structure and a
+    # matching leaf, so skip the structure walk and the two flattens below.
+    if isinstance(arg, ops.Tensor) and isinstance(spec, tensor_spec.TensorSpec):
+      return
+
     # TODO(xjun): Expand this to all CompositeTensors after removing
     # TraceType.Reference usage from IteratorSpec.
     if isinstance(arg, resource_variable_ops.BaseResourceVariable):
@@ -1920,11 +1942,9 @@ class ConcreteFunction(core.ConcreteFunction, trackable.Trackable):
       default_value: optional value to use in environments that cannot safely
         evaluate closure.
     """
-    capture_index = None
-    for i, capture in enumerate(self._captured_inputs):
-      if id(tensor) == id(capture):
-        capture_index = i
-        break
+    capture_index = next(
+        (i for i, capture in enumerate(self._captured_inputs)
+         if capture is tensor), None)
 
     if placeholder is None:
       if capture_index is None:
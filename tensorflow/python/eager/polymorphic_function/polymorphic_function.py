@@ -870,6 +870,10 @@ class Function(core.GenericFunction, trackable.Trackable):
       with trace.Trace(self._name, tf_function_call="eager"):
         return self._python_function(*args, **kwds)
 
+    # The eager/graph mode is scoped, so it is the same before and after the
+    # call below.
+    executing_eagerly = context.executing_eagerly()
+
     # Only count the statistics the first time, before initialization took
     # place.
     if self._created_variables is None:
@@ -881,7 +885,7 @@ class Function(core.GenericFunction, trackable.Trackable):
       # count this special case to correctly record that both jit_compile=True
       # and jit_compile=False is being used for parts of the outer function.
       if ops.executing_eagerly_outside_functions() and (
-          context.executing_eagerly() or compiled):
+          executing_eagerly or compiled):
         # Labels must be strings in Python, so we convert 'compiled' to a string
         _tf_function_counter.get_cell(str(int(compiled))).increase_by(1)
 
@@ -899,7 +903,7 @@ class Function(core.GenericFunction, trackable.Trackable):
       tm.set_metadata(tf_function_call=execution_mode + "-" + compiler,
                       tracing_count=new_tracing_count)
 
-    if context.executing_eagerly():
+    if executing_eagerly:
       if without_tracing:
         _frequent_tracing_detector_manager.called_without_tracing(
             self._key_for_call_stats)
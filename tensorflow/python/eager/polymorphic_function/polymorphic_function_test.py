@@ -14,6 +14,7 @@
 # ==============================================================================
 
 import collections
+import contextlib
 import functools
 import itertools
 import multiprocessing.pool
@@ -90,29 +91,77 @@ from tensorflow.python.util import nest
 from tensorflow.python.util import tf_decorator
 
 
+# Error patterns shared by several tests, compiled once at import time.
+_ERR_NOT_CALLABLE = re.compile(r'is not a callable object')
+_ERR_NOT_BUILDING_FUNCTION = re.compile(r'when not building a function\.')
+_ERR_NO_ATTRIBUTE = re.compile(r'no attribute')
+_ERR_VARIABLES_CAPTURED = re.compile(r'variables are always captured')
+_ERR_GRAPH_EXECUTION_LAMBDA = re.compile(
+    r'Graph execution error.*func=lambda', re.DOTALL)
+
+# Specs reused by several shape-signature tests. TensorSpecs are immutable.
+_SPEC_F32_UNKNOWN = tensor_spec.TensorSpec(None, dtypes.float32)
+_SPEC_F32_2D = tensor_spec.TensorSpec((None, None), dtypes.float32)
+_SPEC_F32_SCALAR = tensor_spec.TensorSpec([], dtypes.float32)
+_SPEC_I32_SCALAR = tensor_spec.TensorSpec([], dtypes.int32)
+_SPEC_BOOL_SCALAR = tensor_spec.TensorSpec([], dtypes.bool)
+_SPEC_F32_VECTOR1 = tensor_spec.TensorSpec((1,), dtypes.float32)
+_SPEC_NEST_WITH_COMPOSITES = {
+    'i': indexed_slices.IndexedSlicesSpec(
+        dtype=dtypes.int32, dense_shape_dtype=dtypes.int32),
+    't': (ragged_tensor.RaggedTensorSpec([2, None, None], dtypes.int32),
+          sparse_tensor.SparseTensorSpec([None], dtypes.int32)),
+}
+
+# A stable namedtuple type, so `nest` sees the same class in every test.
+_Pair = collections.namedtuple('pair', ['a', 'b'])
+
+
 def total_function_cache(defined):
-  return defined._list_all_concrete_functions()  # pylint: disable=protected-access
+  """Returns the concrete functions traced so far, without tracing new ones."""
+  # `Function._list_all_concrete_functions` traces when an input_signature is
+  # set, so read the tracing compilers' caches directly instead.
+  # pylint: disable=protected-access
+  compilers = (defined._variable_creation_fn, defined._no_variable_creation_fn)
+  return [
+      concrete_function for compiler in compilers if compiler is not None
+      for concrete_function in compiler._list_all_concrete_functions()
+  ]
+  # pylint: enable=protected-access
+
 
+def _example_indexed_slices_components():
+  return (constant_op.constant([1, 2]), constant_op.constant([0, 1]),
+          constant_op.constant([2]))
 
-def _example_indexed_slices_with_dense_shape():
+
+def _example_indexed_slices(with_dense_shape):
+  values, indices, dense_shape = _example_indexed_slices_components()
   return indexed_slices.IndexedSlices(
-      constant_op.constant([1, 2]), constant_op.constant([0, 1]),
-      constant_op.constant([2]))
+      values, indices, dense_shape if with_dense_shape else None)
 
 
-def _example_indexed_slices_without_dense_shape():
+def _example_int64_indexed_slices(with_dense_shape):
+  values, _, dense_shape = _example_indexed_slices_components()
   return indexed_slices.IndexedSlices(
-      constant_op.constant([1, 2]), constant_op.constant([0, 1]))
+      values, constant_op.constant([0, 1], dtype=dtypes.int64),
+      dense_shape if with_dense_shape else None)
+
+
+def _leaf_spec(value):
+  """Returns the TypeSpec for a tensor-like leaf, or the leaf itself."""
+  # Eager tensors are by far the most common leaf; skip the isinstance checks.
+  if type(value) is ops.EagerTensor:  # pylint: disable=unidiomatic-typecheck
+    return tensor_spec.TensorSpec(value.shape, value.dtype)
+  if isinstance(value, (ops.Tensor, composite_tensor.CompositeTensor)):
+    return type_spec.type_spec_from_value(value)
+  return value
 
 
 def _spec_for_value(value):
   """Returns the (nested) TypeSpec for a value."""
-  if nest.is_nested(value):
-    return nest.map_structure(_spec_for_value, value)
-  elif isinstance(value, (ops.Tensor, composite_tensor.CompositeTensor)):
-    return type_spec.type_spec_from_value(value)
-  else:
-    return value
+  return nest.pack_sequence_as(
+      value, [_leaf_spec(v) for v in nest.flatten(value)])
 
 
 # This dummy decorator imitates ordinary decorators utilizing tf_decorator.
@@ -135,30 +184,75 @@ class _HasDecoratedMethod(object):
     return x * 3.
 
 
+class _Dummy:
+  pass
+
+
+# The referent is kept alive for the lifetime of the module.
+_DUMMY = _Dummy()
+_DUMMY_WEAKREF = weakref.ref(_DUMMY)
+
+
+# TensorFlow function (which is what would be used in TensorFlow graph
+# construction). Its definition is built lazily on first use and then kept.
+@tf_function.Defun(dtypes.int32, dtypes.int32)
+def _add_int32(a, b):
+  return math_ops.add(a, b)
+
+
+def setUpModule():
+  cpus = config.list_physical_devices('CPU')
+  # Set 4 virtual CPUs. This must happen before the eager context is
+  # initialized, so it is done once here rather than per test.
+  config.set_logical_device_configuration(cpus[0], [
+      context.LogicalDeviceConfiguration(),
+      context.LogicalDeviceConfiguration(),
+      context.LogicalDeviceConfiguration(),
+      context.LogicalDeviceConfiguration()
+  ])
+  # Pay the one-time runtime start-up cost of the first tf.function call here
+  # instead of in whichever test happens to run first.
+  polymorphic_function.function(lambda x: x + 1)(constant_op.constant(1.0))
+
+
 # TODO(mdan): Organize these tests.
 class FunctionTest(test.TestCase, parameterized.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    cpus = config.list_physical_devices('CPU')
-    # Set 4 virtual CPUs
-    config.set_logical_device_configuration(cpus[0], [
-        context.LogicalDeviceConfiguration(),
-        context.LogicalDeviceConfiguration(),
-        context.LogicalDeviceConfiguration(),
-        context.LogicalDeviceConfiguration()
-    ])
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # Shared by the concurrency tests so that each test does not pay for
+    # spinning up (and leaking) its own set of worker threads.
+    cls._pool = multiprocessing.pool.ThreadPool(32)
+    # Eager tensors are immutable, so tests can share these.
+    cls._t22 = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    cls._expected_matmul_t22 = math_ops.matmul(cls._t22, cls._t22).numpy()
+    # `math_ops.matmul` is stateless, so one wrapper (and its trace cache) can
+    # serve every test that only needs a traced matmul.
+    cls._matmul_fn = polymorphic_function.function(math_ops.matmul)
+
+  @classmethod
+  def tearDownClass(cls):
+    cls._pool.close()
+    cls._pool.join()
+    super().tearDownClass()
+
+  @contextlib.contextmanager
+  def _graph_mode_session(self):
+    """Enters graph mode with a cached session and yields the default graph."""
+    with context.graph_mode(), self.cached_session():
+      yield ops.get_default_graph()
 
   def testBasic(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
-    t = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    matmul = self._matmul_fn
+    t = self._t22
     sq = matmul(t, t, transpose_a=True)
     sq2 = matmul(sq, t, transpose_a=True)
-    self.assertAllEqual(sq.numpy().reshape(-1), [10, 14, 14, 20])
-    self.assertAllEqual(sq2.numpy().reshape(-1), [52, 76, 74, 108])
+    self.assertAllEqual(sq, [[10, 14], [14, 20]])
+    self.assertAllEqual(sq2, [[52, 76], [74, 108]])
 
   def testPythonFunctionNotCallable(self):
-    with self.assertRaisesRegex(TypeError, 'is not a callable object'):
+    with self.assertRaisesRegex(TypeError, _ERR_NOT_CALLABLE):
       polymorphic_function.function(1)
 
   def testOnExitCallback(self):
@@ -192,7 +286,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertEqual(values, [1, 2, 1, 2])  # And again.
 
   def testCannotAddExitCallbackWhenNotInFunctionScope(self):
-    with self.assertRaisesRegex(RuntimeError, 'when not building a function.'):
+    with self.assertRaisesRegex(RuntimeError, _ERR_NOT_BUILDING_FUNCTION):
       ops.add_exit_callback_to_default_func_graph(lambda: None)
 
   def testVariable(self):
@@ -209,7 +303,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     r1 = add(v)
     self.assertEqual(2.0, self.evaluate(r1))
     c = constant_op.constant(1.0)
-    with self.assertRaisesRegex(AttributeError, 'no attribute'):
+    with self.assertRaisesRegex(AttributeError, _ERR_NO_ATTRIBUTE):
       add(c)
 
   def testVariableMultiFunction(self):
@@ -229,13 +323,14 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   @test_util.disable_tfrt('Packed tensor is not supported in tfrt yet.')
   def testPackedVariable(self):
-    with ops.device('/cpu:0'):
-      v0_0 = resource_variable_ops.ResourceVariable(1.0)
-    with ops.device('/cpu:1'):
-      v0_1 = resource_variable_ops.ResourceVariable(2.0)
-      v1_0 = resource_variable_ops.ResourceVariable(3.0)
-    with ops.device('/cpu:2'):
-      v1_1 = resource_variable_ops.ResourceVariable(4.0)
+    initial_values = (('/cpu:0', (1.0,)), ('/cpu:1', (2.0, 3.0)),
+                      ('/cpu:2', (4.0,)))
+    created = []
+    for device, values in initial_values:
+      with ops.device(device):
+        created.extend(
+            resource_variable_ops.ResourceVariable(value) for value in values)
+    v0_0, v0_1, v1_0, v1_1 = created
 
     packed_var_0 = ops.pack_eager_tensors([v0_0.handle, v0_1.handle])
     packed_var_1 = ops.pack_eager_tensors([v1_0.handle, v1_1.handle])
@@ -275,12 +370,12 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
   def testImplementsAttributeBasic(self):
     v = polymorphic_function.function(
         experimental_implements='func')(lambda x, y: x + y)
-    with context.graph_mode(), self.cached_session():
+    with self._graph_mode_session() as graph:
       a = array_ops.placeholder(dtypes.float32, ())
       b = array_ops.placeholder(dtypes.float32, ())
       v(a, b)
       gradients_impl.gradients(v(a, b), [a, b])
-      fdefs = ops.get_default_graph().as_graph_def().library.function
+      fdefs = graph.as_graph_def().library.function
       self.assertLen(fdefs, 3)
       not_present = 0
       present = 0
@@ -299,16 +394,15 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       self.assertEqual(present, 1, fdefs)
 
   def testImplementsAttributeAssertsOnSideInput(self):
-    with context.graph_mode(), self.cached_session():
+    with self._graph_mode_session() as graph:
       z = array_ops.zeros(0)
       v = polymorphic_function.function(
           experimental_implements='func')(lambda x, y: x + y + z)
       a = array_ops.ones((1,))
       b = array_ops.ones((1,))
-      with self.assertRaisesRegex(AssertionError,
-                                  'variables are always captured'):
+      with self.assertRaisesRegex(AssertionError, _ERR_VARIABLES_CAPTURED):
         v(a, b)
-      functions = ops.get_default_graph().as_graph_def().library.function
+      functions = graph.as_graph_def().library.function
       self.assertEmpty(functions)
 
   def testImplementsAttributeWorksWithGradientTape(self):
@@ -325,14 +419,14 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertEqual(dg_dx.numpy(), 1.0)
 
   def testImplementsAttributeWorksOnVariables(self):
-    with context.graph_mode(), self.cached_session():
+    with self._graph_mode_session() as graph:
       v = polymorphic_function.function(
           experimental_implements='func')(lambda x, y: x + y)
       a = variables.Variable((1.0,))
       b = variables.Variable((1.0,))
       r1 = v(a, b)
       _ = v(a, a)
-      functions = ops.get_default_graph().as_graph_def().library.function
+      functions = graph.as_graph_def().library.function
       # Verify that we created only one function
       self.assertLen(functions, 1)
       # Verify that self.evaluate() reads the current values.
@@ -344,13 +438,13 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       self.assertEqual(self.evaluate(r1), 3)
 
   def testImplementsAttributeWorksOnConstants(self):
-    with context.graph_mode(), self.cached_session():
+    with self._graph_mode_session() as graph:
       v = polymorphic_function.function(
           experimental_implements='func')(lambda x, y: x + y)
       a = variables.Variable(1.0)
       r1 = v(a, 2.)
       r2 = v(2., a)
-      functions = ops.get_default_graph().as_graph_def().library.function
+      functions = graph.as_graph_def().library.function
       self.assertLen(functions, 1)
       self.assertLen(functions[0].signature.input_arg, 2)
       # Verify that self.evaluate() reads the current values.
@@ -359,13 +453,13 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       self.assertEqual(self.evaluate(r2), 3)
 
   def testImplementsAttributeSpecializes(self):
-    with context.graph_mode(), self.cached_session():
+    with self._graph_mode_session() as graph:
       v = polymorphic_function.function(
           experimental_implements='func')(lambda x, y: x + y)
       a = variables.Variable(1.0)
       r1 = v(a, [2.])
       r2 = v([2., 2], a)
-      functions = ops.get_default_graph().as_graph_def().library.function
+      functions = graph.as_graph_def().library.function
       self.assertLen(functions, 2)
       # Ensure that all parameters are still there and haven't been inlined!
 
@@ -379,9 +473,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
   def testImplementsWorksWithTensorSpec(self):
     v = polymorphic_function.function(
         experimental_implements='func')(lambda x, y: x + y)
-    v = v.get_concrete_function(
-        tensor_spec.TensorSpec(shape=None, dtype=dtypes.float32),
-        tensor_spec.TensorSpec(shape=None, dtype=dtypes.float32))
+    v = v.get_concrete_function(_SPEC_F32_UNKNOWN, _SPEC_F32_UNKNOWN)
     x = v(1., 2.)
     self.assertEqual(x.numpy(), 3.)
 
@@ -391,12 +483,12 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
         '} attr {   key: "key2"   value {     b: false   } }')
     v = polymorphic_function.function(
         experimental_implements=implements_attr)(lambda x, y: x + y)
-    with context.graph_mode(), self.cached_session():
+    with self._graph_mode_session() as graph:
       a = array_ops.placeholder(dtypes.float32, ())
       b = array_ops.placeholder(dtypes.float32, ())
       v(a, b)
       gradients_impl.gradients(v(a, b), [a, b])
-      fdefs = ops.get_default_graph().as_graph_def().library.function
+      fdefs = graph.as_graph_def().library.function
       self.assertLen(fdefs, 3)
       not_present = 0
       present = 0
@@ -623,9 +715,11 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertAllEqual(self.evaluate(foo(array_ops.ones([1]))), [1])
     self.assertEqual(traced_shape, (1,))
 
-    for rank in range(2, 6):
-      x_shape = self.evaluate(foo(array_ops.ones([1] * rank)))
-      self.assertAllEqual(x_shape, [1] * rank)
+    shapes = [[1] * rank for rank in range(2, 6)]
+    inputs = [array_ops.ones(shape) for shape in shapes]
+    for shape, ones in zip(shapes, inputs):
+      x_shape = self.evaluate(foo(ones))
+      self.assertAllEqual(x_shape, shape)
       self.assertEqual(traced_shape, (None,))
 
   def testNoHash(self):
@@ -639,34 +733,33 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       f(set([]))
 
   def testBasicGraphMode(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
     @polymorphic_function.function
     def sq(a):
       return matmul(a, a)
 
-    t = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
-    out = sq(t)
-    self.assertAllEqual(out, math_ops.matmul(t, t).numpy())
+    out = sq(self._t22)
+    self.assertAllEqual(out, self._expected_matmul_t22)
 
   def testNestedInputsGraphMode(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
-    pair = collections.namedtuple('pair', ['a', 'b'])
+    pair = _Pair
 
     @polymorphic_function.function
     def a_times_b(inputs):
       return matmul(inputs.a['a'], inputs.b['b'])
 
-    t = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    t = self._t22
 
     out = a_times_b(pair({'a': t}, {'b': t}))
-    self.assertAllEqual(out, math_ops.matmul(t, t).numpy())
+    self.assertAllEqual(out, self._expected_matmul_t22)
 
   def testNestedOutputsGraphMode(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
-    pair = collections.namedtuple('pair', ['a', 'b'])
+    pair = _Pair
 
     @polymorphic_function.function()
     def pairs_mul(pair_a, pair_b):
@@ -706,18 +799,18 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertIs(ops.get_default_graph(), concrete.graph.outer_graph)
 
   def testBasicGraphFunction(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
     @polymorphic_function.function
     def sq(a):
       return matmul(a, a)
 
-    t = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    t = self._t22
 
     sq_op = sq.get_concrete_function(t)
     self.assertEqual(sq_op.output_shapes, tensor_shape.TensorShape([2, 2]))
     out = sq_op(t)
-    self.assertAllEqual(out, math_ops.matmul(t, t).numpy())
+    self.assertAllEqual(out, self._expected_matmul_t22)
 
   def testGetConcreteFunctionThreadSafety(self):
 
@@ -732,9 +825,11 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       cf = sq.get_concrete_function()
       concrete_functions.append(cf)
 
+    # This test needs one thread per call to exercise 100-way concurrency, so
+    # it does not use the shared pool.
     num_threads = 100
-    pool = multiprocessing.pool.ThreadPool(num_threads)
-    _ = pool.map(thread_func, list(range(num_threads)))
+    with multiprocessing.pool.ThreadPool(num_threads) as pool:
+      _ = pool.map(thread_func, list(range(num_threads)))
 
     self.assertLen(set(concrete_functions), 1)
 
@@ -744,43 +839,38 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     def add_100(*args):
       return math_ops.add_n(args)
 
-    p = multiprocessing.pool.ThreadPool(2)
     args = (constant_op.constant(1.),) * 100
-    f1, f2 = p.map(add_100.get_concrete_function, [args] * 2)
+    f1, f2 = self._pool.map(add_100.get_concrete_function, [args] * 2)
     # I see about len(args) + max(0, len(args) - 3) arguments expected.
     f1(*args)
     del f2
 
   def testInputSpecGraphFunction(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
     @polymorphic_function.function
     def sq(a):
       return matmul(a, a)
 
-    sq_op = sq.get_concrete_function(
-        tensor_spec.TensorSpec((None, None), dtypes.float32))
+    sq_op = sq.get_concrete_function(_SPEC_F32_2D)
     self.assertEqual([None, None], sq_op.output_shapes.as_list())
 
-    t1 = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
-    out1 = sq_op(t1)
-    self.assertAllEqual(out1, math_ops.matmul(t1, t1).numpy())
+    out1 = sq_op(self._t22)
+    self.assertAllEqual(out1, self._expected_matmul_t22)
 
     t2 = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
     out2 = sq_op(t2)
-    self.assertAllEqual(out2, math_ops.matmul(t2, t2).numpy())
+    self.assertAllEqual(out2, math_ops.matmul(t2, t2))
 
   def testNestedInputSpecGraphFunction(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
     @polymorphic_function.function
     def sq(mats):
       ((a, b),) = mats
       return matmul(a, b)
 
-    sq_op_autonamed = sq.get_concrete_function([(tensor_spec.TensorSpec(
-        (None, None),
-        dtypes.float32), tensor_spec.TensorSpec((None, None), dtypes.float32))])
+    sq_op_autonamed = sq.get_concrete_function([(_SPEC_F32_2D, _SPEC_F32_2D)])
     self.assertEqual([None, None], sq_op_autonamed.output_shapes.as_list())
 
     sq_op = sq.get_concrete_function([(tensor_spec.TensorSpec((None, None),
@@ -792,13 +882,11 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
                                            name='second_mat'))])
     self.assertEqual([None, None], sq_op.output_shapes.as_list())
 
-    t1 = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    t1 = self._t22
     t2 = constant_op.constant([[1.4, 2.4], [3.4, 4.4]])
     out = sq_op(first_mat=t1, second_mat=t2)
-    self.assertAllEqual(out, math_ops.matmul(t1, t2).numpy())
-    self.assertAllEqual(
-        sq_op_autonamed(t1, t2),
-        math_ops.matmul(t1, t2).numpy())
+    self.assertAllEqual(out, math_ops.matmul(t1, t2))
+    self.assertAllEqual(sq_op_autonamed(t1, t2), math_ops.matmul(t1, t2))
 
   def testExecutingStatelessDefunConcurrently(self):
 
@@ -806,9 +894,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     def stateless(x):
       return math_ops.multiply(2.0, x)
 
-    pool = multiprocessing.pool.ThreadPool()
     inputs = [constant_op.constant(1.0 * x) for x in range(100)]
-    outputs = [float(out) for out in pool.map(stateless, inputs)]
+    outputs = [float(out) for out in self._pool.map(stateless, inputs)]
     expected = [float(2.0 * x) for x in inputs]
     self.assertSequenceEqual(outputs, expected)
 
@@ -819,10 +906,9 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       del x
       return math_ops.multiply(2.0, 2.0)
 
-    pool = multiprocessing.pool.ThreadPool()
     # `pool.map` below instantiates 100 functions, one for each object.
     objects = [object() for _ in range(100)]
-    outputs = [float(out) for out in pool.map(stateless, objects)]
+    outputs = [float(out) for out in self._pool.map(stateless, objects)]
     expected = [4.0] * 100
     self.assertSequenceEqual(outputs, expected)
 
@@ -835,9 +921,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     def stateful(x):
       v.assign(x)
 
-    pool = multiprocessing.pool.ThreadPool()
     inputs = [constant_op.constant(0.0)] * 100
-    pool.map(stateful, inputs)
+    self._pool.map(stateful, inputs)
     self.assertEqual(float(v.read_value()), 0.0)
 
   def testExecutingManyStatefulDefunsConcurrently(self):
@@ -849,9 +934,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       del x
       return v.assign(0.0)
 
-    pool = multiprocessing.pool.ThreadPool()
     # `pool.map` below instantiates 100 functions, one for each object.
-    pool.map(stateful, [object() for _ in range(100)])
+    self._pool.map(stateful, [object() for _ in range(100)])
     self.assertEqual(float(v.read_value()), 0.0)
 
   def testShareRendezvous(self):
@@ -864,7 +948,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     cpu = '/device:CPU:0'
 
-    signature = [tensor_spec.TensorSpec([], dtypes.int32)]
+    signature = [_SPEC_I32_SCALAR]
 
     @polymorphic_function.function
     def send():
@@ -899,9 +983,9 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     # while boundary.
     @polymorphic_function.function
     def fn(n):
-      functional_ops.While([n], cond.get_concrete_function(),
-                           send_body.get_concrete_function())
-      return functional_ops.While([n], cond.get_concrete_function(),
+      cond_fn = cond.get_concrete_function()
+      functional_ops.While([n], cond_fn, send_body.get_concrete_function())
+      return functional_ops.While([n], cond_fn,
                                   recv_body.get_concrete_function())
 
     # Use a graph context since functions will not be automatically inlined
@@ -921,31 +1005,31 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertAllEqual(f(), x)
 
   def testNestedInputsGraphFunction(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
-    pair = collections.namedtuple('pair', ['a', 'b'])
+    pair = _Pair
 
     @polymorphic_function.function
     def a_times_b(inputs):
       return matmul(inputs.a['a'], inputs.b['b'])
 
-    t = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    t = self._t22
     sq_op = a_times_b.get_concrete_function(
         pair(
             dict(a=tensor_spec.TensorSpec([2, 2], dtypes.float32, 'a')),
             dict(b=tensor_spec.TensorSpec([2, 2], dtypes.float32, 'b'))))
     self.assertEqual(sq_op.output_shapes, tensor_shape.TensorShape([2, 2]))
     out = sq_op(a=t, b=t)
-    self.assertAllEqual(out, math_ops.matmul(t, t).numpy())
+    self.assertAllEqual(out, self._expected_matmul_t22)
 
   def testNestedOutputGraphFunction(self):
-    matmul = polymorphic_function.function(math_ops.matmul)
+    matmul = self._matmul_fn
 
     @polymorphic_function.function
     def sq(a):
       return (matmul(a, a), {'b': constant_op.constant(1.0)})
 
-    t = constant_op.constant([[1.0, 2.0], [3.0, 4.0]])
+    t = self._t22
 
     sq_op = sq.get_concrete_function(t)
     self.assertEqual(sq_op.output_shapes, (tensor_shape.TensorShape([2, 2]), {
@@ -955,8 +1039,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
         'b': dtypes.float32
     }))
     (a, b) = sq_op(t)
-    self.assertAllEqual(a, math_ops.matmul(t, t).numpy())
-    self.assertAllEqual(b['b'].numpy(), 1.0)
+    self.assertAllEqual(a, self._expected_matmul_t22)
+    self.assertAllEqual(b['b'], 1.0)
 
   def testGraphFunctionNoneOutput(self):
 
@@ -1083,30 +1167,12 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     v.assign(2.0)
     self.assertAllEqual(graph_function(), 1.0)
 
-  def testDefunShapeInferenceWithCapturedResourceVariable(self):
-    v = resource_variable_ops.ResourceVariable([[1, 2], [3, 4]])
-
-    def f():
-      x = constant_op.constant([[1, 2], [3, 4]])
-      out = math_ops.matmul(v, x)
-      self.assertEqual(out.shape, tensor_shape.TensorShape([2, 2]))
-      # We do not return v directly since the tensor conversion function of
-      # ResourceVariable returns the read value and not the resource itself.
-      return v._handle
-
-    compiled = polymorphic_function.function(f)
-    var_handle = compiled()
-    self.assertEqual(var_handle.dtype, dtypes.resource)
-    self.assertEqual(var_handle.shape, tensor_shape.TensorShape([]))
-    var_t = resource_variable_ops.read_variable_op(var_handle, dtype=v.dtype)
-    self.assertEqual(var_t.shape, tensor_shape.TensorShape([2, 2]))
-
   def testShapeInferenceForMoreSpecificInput(self):
 
     def f(a):
       return array_ops.reshape(a, [-1, 3])
 
-    signature = [tensor_spec.TensorSpec(None, dtypes.float32)]
+    signature = [_SPEC_F32_UNKNOWN]
     compiled = polymorphic_function.function(f, input_signature=signature)
 
     @polymorphic_function.function
@@ -1116,9 +1182,15 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     use_f()
 
-  def testDefunShapeInferenceWithCapturedResourceVariableInGraphMode(self):
-    with context.graph_mode():
-      v = resource_variable_ops.ResourceVariable([[1, 2], [3, 4]])
+  @parameterized.named_parameters(
+      ('ResourceVariable', False, resource_variable_ops.ResourceVariable),
+      ('ResourceVariableInGraphMode', True,
+       resource_variable_ops.ResourceVariable),
+      ('VariableInGraphMode', True, variables.Variable))
+  def testDefunShapeInferenceWithCaptured(self, graph_mode, make_variable):
+    mode = context.graph_mode() if graph_mode else contextlib.nullcontext()
+    with mode:
+      v = make_variable([[1, 2], [3, 4]])
 
       def f():
         x = constant_op.constant([[1, 2], [3, 4]])
@@ -1128,6 +1200,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
         # ResourceVariable returns the read value and not the resource itself.
         return v._handle
 
+      # Check that shape inference works while creating the defun
       compiled = polymorphic_function.function(f)
       var_handle = compiled()
       self.assertEqual(var_handle.dtype, dtypes.resource)
@@ -1135,28 +1208,10 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       var_t = resource_variable_ops.read_variable_op(var_handle, dtype=v.dtype)
       self.assertEqual(var_t.shape, tensor_shape.TensorShape([2, 2]))
 
-  def testDefunShapeInferenceWithCapturedVariableInGraphMode(self):
-    with context.graph_mode():
-      v = variables.Variable([[1, 2], [3, 4]])
-
-      def f():
-        x = constant_op.constant([[1, 2], [3, 4]])
-        out = math_ops.matmul(v, x)
-        self.assertEqual(out.shape, tensor_shape.TensorShape([2, 2]))
-
-      # Check that shape inference works while creating the defun
-      compiled = polymorphic_function.function(f)
-      compiled()
-
   def testDefunShapeInferenceWithCapturedTensorListInGraphMode(self):
     with context.graph_mode():
-      tensor_list = list_ops.empty_tensor_list(
-          element_dtype=dtypes.float32,
-          element_shape=ops.convert_to_tensor([], dtype=dtypes.int32))
-      tensor_list = list_ops.tensor_list_push_back(tensor_list,
-                                                   constant_op.constant(1.0))
-      tensor_list = list_ops.tensor_list_push_back(tensor_list,
-                                                   constant_op.constant(2.0))
+      tensor_list = list_ops.tensor_list_from_tensor(
+          constant_op.constant([1.0, 2.0]), element_shape=[])
 
       def f():
         tl, value = list_ops.tensor_list_pop_back(
@@ -1227,14 +1282,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     def f(x):
       return x
 
-    class Dummy:
-      pass
-
-    o = Dummy()
-    wr = weakref.ref(o)
-
     with self.assertRaisesRegex(ValueError, 'weakref'):
-      f(wr)
+      f(_DUMMY_WEAKREF)
 
   def testTensorConversionWithDefun(self):
 
@@ -1298,9 +1347,9 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   @parameterized.named_parameters([
       ('IndexedSlicesWithDenseShape',
-       _example_indexed_slices_with_dense_shape,),
+       _example_indexed_slices, {'with_dense_shape': True}),
       ('IndexedSlicesWithoutDenseShape',
-       _example_indexed_slices_without_dense_shape,),
+       _example_indexed_slices, {'with_dense_shape': False}),
       ('RaggedTensorRaggedRank1', ragged_tensor.RaggedTensor.from_row_lengths,
        {'values': [1, 2, 3], 'row_lengths': [2, 0, 1]}),
       ('RaggedTensorRaggedRank2',
@@ -1330,9 +1379,9 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   @parameterized.named_parameters([
       ('IndexedSlicesWithDenseShape',
-       _example_indexed_slices_with_dense_shape,),
+       _example_indexed_slices, {'with_dense_shape': True}),
       ('IndexedSlicesWithoutDenseShape',
-       _example_indexed_slices_without_dense_shape,),
+       _example_indexed_slices, {'with_dense_shape': False}),
       ('RaggedTensorRaggedRank1',
        ragged_tensor.RaggedTensor.from_row_lengths,
        {'values': [1, 2, 3], 'row_lengths': [2, 0, 1]}),
@@ -1395,8 +1444,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
   def testFunctionOnDevice(self):
     x = constant_op.constant([1.]).gpu()
     f = polymorphic_function.function(math_ops.add)
-    y = f(x, x).cpu()
-    self.assertAllEqual(y, [2.])
+    self.assertAllEqual(f(x, x), [2.])
 
   @test_util.run_gpu_only
   @test_util.run_in_graph_and_eager_modes
@@ -1461,11 +1509,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertAllEqual(my_function(1), None)
 
   def testNestedFunctions(self):
-    # TensorFlow function (which is what would be used in TensorFlow graph
-    # construction).
-    @tf_function.Defun(dtypes.int32, dtypes.int32)
-    def add(a, b):
-      return math_ops.add(a, b)
+    add = _add_int32
 
     @polymorphic_function.function
     def add_one(x):
@@ -1600,6 +1644,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     with ops.device(None):
       self.assertEqual(0., self.evaluate(cpu_graph_function()))
 
+    # Traced again on purpose: the device scope is part of the cache key, and
+    # this checks a function traced without any device scope.
     default_graph_function = defined.get_concrete_function()
     self.assertEqual(
         self.evaluate(default_graph_function()), self.evaluate(func()))
@@ -1726,15 +1772,12 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       else:
         return -1.0 * a
 
-    signature = [
-        tensor_spec.TensorSpec([], dtypes.float32),
-        tensor_spec.TensorSpec([], dtypes.bool),
-    ]
+    signature = [_SPEC_F32_SCALAR, _SPEC_BOOL_SCALAR]
     defined = polymorphic_function.function(foo, input_signature=signature)
     a = constant_op.constant(1.0)
-    self.assertAllEqual(a.numpy(), defined(a))
-    self.assertAllEqual(a.numpy(), defined(a, training=True))
-    self.assertAllEqual(-a.numpy(), defined(a, training=False))
+    self.assertAllEqual(a, defined(a))
+    self.assertAllEqual(a, defined(a, training=True))
+    self.assertAllEqual(-a, defined(a, training=False))
 
   def testVariableSpecWithInputSignature(self):
 
@@ -1825,18 +1868,15 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       return math_ops.add(x, y)
 
     py_add(array_ops.ones([]), array_ops.ones([]))
-    add = py_add.get_concrete_function(
-        tensor_spec.TensorSpec(None, dtypes.float32),
-        tensor_spec.TensorSpec(None, dtypes.float32))
+    add = py_add.get_concrete_function(_SPEC_F32_UNKNOWN, _SPEC_F32_UNKNOWN)
 
     @polymorphic_function.function
     def py_composite(x, y):
       return x, add(x, y)
 
     py_composite(array_ops.ones([]), array_ops.ones([]))
-    composite = py_composite.get_concrete_function(
-        tensor_spec.TensorSpec(None, dtypes.float32),
-        tensor_spec.TensorSpec(None, dtypes.float32))
+    composite = py_composite.get_concrete_function(_SPEC_F32_UNKNOWN,
+                                                   _SPEC_F32_UNKNOWN)
 
     with context.graph_mode(), self.cached_session():
       with ops.get_default_graph().as_default():
@@ -1934,9 +1974,6 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     with self.assertRaises(TypeError):
       graph_function(v1, v2)
 
-  def _total_function_cache_def_func(self, defined):
-    return defined._list_all_concrete_functions()  # pylint: disable=protected-access
-
   @parameterized.parameters([(True), (False)])
   def testVariableRetracingOnDtypeChanges(self, reduce_retracing):
 
@@ -1948,13 +1985,13 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     x2 = resource_variable_ops.ResourceVariable(0.0)
 
     defined(x1, x2)
-    self.assertLen(self._total_function_cache_def_func(defined), 1)
+    self.assertLen(total_function_cache(defined), 1)
 
     # Should expect retracing for new dtypes
     y1 = resource_variable_ops.ResourceVariable(0)
     y2 = resource_variable_ops.ResourceVariable(1)
     defined(y1, y2)
-    self.assertLen(self._total_function_cache_def_func(defined), 2)
+    self.assertLen(total_function_cache(defined), 2)
 
   def testVariableRetracingDtypeShape(self):
 
@@ -1966,18 +2003,18 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     x2 = resource_variable_ops.ResourceVariable(0.0)
 
     defined(x1, x2)
-    self.assertLen(self._total_function_cache_def_func(defined), 1)
+    self.assertLen(total_function_cache(defined), 1)
 
     y1 = resource_variable_ops.ResourceVariable([0.0, 1.0])
     y2 = resource_variable_ops.ResourceVariable([0.0, 1.0])
 
     defined(y1, y2)
-    self.assertLen(self._total_function_cache_def_func(defined), 2)
+    self.assertLen(total_function_cache(defined), 2)
 
     z1 = resource_variable_ops.ResourceVariable([[0.0, 1.0]])
     z2 = resource_variable_ops.ResourceVariable([[0.0, 1.0]])
     defined(z1, z2)
-    self.assertLen(self._total_function_cache_def_func(defined), 3)
+    self.assertLen(total_function_cache(defined), 3)
 
   def testFunctionModifiesInputList(self):
     # Tests on `list` methods that do in place modification, except `list.sort`
@@ -2036,16 +2073,13 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
       remove(get_list())
 
-    # `list.clear` is a method that is in Py3 but not Py2
-    if sys.version.startswith('3'):
-
-      with self.assertRaisesRegex(ValueError, expected_msg):
+    with self.assertRaisesRegex(ValueError, expected_msg):
 
-        @polymorphic_function.function
-        def clear(l):
-          l.clear()
+      @polymorphic_function.function
+      def clear(l):
+        l.clear()
 
-        clear(get_list())
+      clear(get_list())
 
     # One last test for keyword arguments
     with self.assertRaisesRegex(ValueError, expected_msg):
@@ -2184,10 +2218,14 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       trace_count[0] += 1
       return x
 
+    # Only the first input changes between iterations; it still covers new
+    # objects with an already-seen TypeSpec not causing a retrace.
+    rank1 = ragged_factory_ops.constant([[1, 2], [], [3, 4, 5]])
+    rank2 = ragged_factory_ops.constant([[[1, 2], [3]], [[4, 5, 6]]])
     for i in range(10):
       f(ragged_factory_ops.constant([[1, 2], [i]]))
-      f(ragged_factory_ops.constant([[1, 2], [], [3, 4, 5]]))
-      f(ragged_factory_ops.constant([[[1, 2], [3]], [[4, 5, 6]]]))
+      f(rank1)
+      f(rank2)
       self.assertEqual(trace_count[0], 3)
 
   def testCompositeTensorsWithReducedRetracing(self):
@@ -2226,8 +2264,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     # Calling a function from eager doesn't do any shape checking above what
     # kernels do while executing.
-    self.assertAllEqual([2., 3.],
-                        f_concrete(constant_op.constant([1., 2.])).numpy())
+    self.assertAllEqual([2., 3.], f_concrete(constant_op.constant([1., 2.])))
 
     @polymorphic_function.function
     def g():
@@ -2250,9 +2287,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       return array_ops.reshape(y, [n, x_batch, -1])
 
     conc = _uses_symbolic_shapes.get_concrete_function(
-        tensor_spec.TensorSpec(None, dtypes.float32),
-        tensor_spec.TensorSpec(None, dtypes.float32),
-        tensor_spec.TensorSpec(None, dtypes.float32))
+        _SPEC_F32_UNKNOWN, _SPEC_F32_UNKNOWN, _SPEC_F32_UNKNOWN)
 
     @polymorphic_function.function
     def _call_concrete():
@@ -2340,7 +2375,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     c_mgr = cancellation.CancellationManager()
     cancelable_func = c_mgr.get_cancelable_function(f.get_concrete_function())
 
-    self.assertAllEqual(37, cancelable_func().numpy())
+    self.assertAllEqual(37, cancelable_func())
 
     # Cancellation after the function executes is a no-op.
     c_mgr.start_cancel()
@@ -2357,15 +2392,17 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     c = constant_op.constant(30)
     d = {'a': a, 'b': b}
     e = (c, 4)
+    d_spec = _spec_for_value(d)
+    e_spec = _spec_for_value(e)
 
     # Test different argument signatures when constructing the concrete func.
     for cf in [
         f.get_concrete_function(d, e),
         f.get_concrete_function(d, y=e),
         f.get_concrete_function(y=e, x=d),
-        f.get_concrete_function(_spec_for_value(d), _spec_for_value(e)),
-        f.get_concrete_function(_spec_for_value(d), y=_spec_for_value(e)),
-        f.get_concrete_function(y=_spec_for_value(e), x=_spec_for_value(d))
+        f.get_concrete_function(d_spec, e_spec),
+        f.get_concrete_function(d_spec, y=e_spec),
+        f.get_concrete_function(y=e_spec, x=d_spec)
     ]:
       # Test different calling conventions when calling the concrete func.
       for output in [
@@ -2445,7 +2482,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   @test_util.run_in_graph_and_eager_modes
   def testConcreteFunctionMethodWithVarargs(self):
-    float32_scalar = tensor_spec.TensorSpec(shape=(), dtype=dtypes.float32)
+    float32_scalar = _SPEC_F32_SCALAR
 
     class MyModel(module.Module):
 
@@ -2840,7 +2877,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
   def testPrettyPrintedExplicitSignatureWithKeywordArg(self):
 
     @polymorphic_function.function(
-        input_signature=[tensor_spec.TensorSpec(None)])
+        input_signature=[_SPEC_F32_UNKNOWN])
     def fn(a, b=1):
       return a + b
 
@@ -3056,7 +3093,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     @polymorphic_function.function(input_signature=[
         tensor_spec.TensorSpec((None, None), dtype=dtypes.int32),
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
+        _SPEC_I32_SCALAR,
     ])
     def f(x, s):
       old_shape = array_ops.shape(x)
@@ -3079,7 +3116,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     @polymorphic_function.function(input_signature=[
         tensor_spec.TensorSpec((None, None), dtype=dtypes.int32),
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
+        _SPEC_I32_SCALAR,
     ])
     def f(x, s):
       s0, _ = array_ops.unstack(array_ops.shape(x), axis=0)
@@ -3101,9 +3138,9 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
   def testShapeInferencePropagateConstNestedConcat(self):
 
     @polymorphic_function.function(input_signature=[
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
+        _SPEC_I32_SCALAR,
+        _SPEC_I32_SCALAR,
+        _SPEC_I32_SCALAR,
     ])
     def f(d1, d2, d3):
       new_shape = array_ops.concat([[d1], [d2], [d3]], axis=-1)
@@ -3121,9 +3158,9 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
   def testShapeInferencePropagateConstDoubleNested(self):
 
     @polymorphic_function.function(input_signature=[
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
-        tensor_spec.TensorSpec((), dtype=dtypes.int32),
+        _SPEC_I32_SCALAR,
+        _SPEC_I32_SCALAR,
+        _SPEC_I32_SCALAR,
     ])
     def f(d1, d2, d3):
       new_shape = array_ops.concat([[d1], [d2], [d3]], axis=-1)
@@ -3162,21 +3199,23 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   @test_util.run_v2_only
   def testReadInFuncWriteOutside(self):
-    # Run many times since we are testing for a potential race condition.
-    for _ in range(30):
-      # pylint: disable=cell-var-from-loop
-      v = variables.Variable(1.)
+    v = variables.Variable(1.)
 
-      @polymorphic_function.function
-      def add_one():
-        return v + 1.
+    @polymorphic_function.function
+    def add_one():
+      return v + 1.
 
-      @polymorphic_function.function
-      def get_v_plus_one():
-        v_plus_one = add_one()
-        v.assign_add(2.0)
-        return v_plus_one
+    @polymorphic_function.function
+    def get_v_plus_one():
+      v_plus_one = add_one()
+      v.assign_add(2.0)
+      return v_plus_one
 
+    # Run many times since we are testing for a potential race condition. The
+    # race is between the ops at execution time, so trace once and reset the
+    # variable before each run.
+    for _ in range(30):
+      v.assign(1.)
       self.assertAllEqual(get_v_plus_one(), 2.0)
 
   def testOpExpandErrorMessage(self):
@@ -3189,8 +3228,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
         return script_ops.eager_py_func(
             func=lambda: array_ops.constant([2.]), inp=(), Tout=dtypes.int32)
 
-    error_pattern = re.compile(r'Graph execution error.*func=lambda', re.DOTALL)
-    with self.assertRaisesRegex(errors.InvalidArgumentError, error_pattern):
+    with self.assertRaisesRegex(errors.InvalidArgumentError,
+                                _ERR_GRAPH_EXECUTION_LAMBDA):
       test_fn()
 
   def testNoVariables(self):
@@ -3538,15 +3577,13 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   def test_concrete_function_from_signature(self):
 
-    @polymorphic_function.function(
-        input_signature=[tensor_spec.TensorSpec(None, dtypes.float32)])
+    @polymorphic_function.function(input_signature=[_SPEC_F32_UNKNOWN])
     def compute(x):
       return 2. * x
 
     concrete = compute.get_concrete_function()
     self.assertAllClose(1., concrete(constant_op.constant(0.5)))
-    concrete = compute.get_concrete_function(
-        tensor_spec.TensorSpec(None, dtypes.float32))
+    concrete = compute.get_concrete_function(_SPEC_F32_UNKNOWN)
     self.assertAllClose(4., concrete(constant_op.constant(2.)))
     signature_args, _ = concrete.structured_input_signature
     self.assertEqual(signature_args,
@@ -3577,7 +3614,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     m = MyModule()
     tf_func_dec = polymorphic_function.function(
-        input_signature=(tensor_spec.TensorSpec([], dtypes.int32),))
+        input_signature=(_SPEC_I32_SCALAR,))
     error_message = 'input_signature missing type constraint'
     with self.assertRaisesRegex(TypeError, error_message):
       tf_func_dec(m.f1)(1, 2, 3)
@@ -3598,7 +3635,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   def testInputSignatureMissingTensorSpecsFunction(self):
     tf_func_dec = polymorphic_function.function(
-        input_signature=(tensor_spec.TensorSpec([], dtypes.int32),))
+        input_signature=(_SPEC_I32_SCALAR,))
     error_message = 'input_signature missing type constraint'
     # pylint: disable=unused-argument
     def f1(arg1, arg2, arg3):
@@ -3638,7 +3675,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
   def testInputSignatureMissingTensorSpecsLambdaFunction(self):
     tf_func_dec = polymorphic_function.function(
-        input_signature=(tensor_spec.TensorSpec([], dtypes.int32),))
+        input_signature=(_SPEC_I32_SCALAR,))
     error_message = 'input_signature missing type constraint'
     with self.assertRaisesRegex(TypeError, error_message):
       tf_func_dec(lambda ar1, arg2, arg3: None)(1, 2, 3)
@@ -3676,7 +3713,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
 
     error_message = 'input_signature missing type constraint'
     tf_func_dec = polymorphic_function.function(
-        input_signature=(tensor_spec.TensorSpec([], dtypes.int32),)
+        input_signature=(_SPEC_I32_SCALAR,)
     )
     with self.assertRaisesRegex(TypeError, error_message):
       tf_func_dec(functools.partial(f, 1))(2, 3)
@@ -3734,7 +3771,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertEqual('y', signature_args[0].name)
 
     # If name is not specified, the previously named one will be returned.
-    conc = f.get_concrete_function(tensor_spec.TensorSpec(None, dtypes.float32))
+    conc = f.get_concrete_function(_SPEC_F32_UNKNOWN)
     conc(x=constant_op.constant(3.0))
     signature_args, _ = conc.structured_input_signature
     self.assertEqual('y', signature_args[0].name)
@@ -3876,10 +3913,8 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       return a + b + c + d
 
     concrete = non_unique_arg_names.get_concrete_function(
-        (tensor_spec.TensorSpec(None, dtypes.float32),
-         tensor_spec.TensorSpec(None, dtypes.float32),
-         tensor_spec.TensorSpec(None, dtypes.float32)),
-        d=tensor_spec.TensorSpec(None, dtypes.float32))
+        (_SPEC_F32_UNKNOWN, _SPEC_F32_UNKNOWN, _SPEC_F32_UNKNOWN),
+        d=_SPEC_F32_UNKNOWN)
     self.assertAllClose(
         10.,
         concrete(x=constant_op.constant(1.),
@@ -4431,7 +4466,7 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
       return x
 
     @polymorphic_function.function(
-        input_signature=[tensor_spec.TensorSpec(None)]
+        input_signature=[_SPEC_F32_UNKNOWN]
     )
     def general(x):
       return specific(x)
@@ -4610,7 +4645,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     concrete_fn.replace_capture_with_deferred_capture(
         concrete_fn.captured_inputs[1],
         closure,
-        spec=tensor_spec.TensorSpec(shape=(), dtype=dtypes.float32),
+        spec=_SPEC_F32_SCALAR,
         placeholder=concrete_fn.inputs[1])
 
     self.assertAllEqual(concrete_fn(), 8.0)
@@ -4626,8 +4661,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def fn():
       deferred_tensor = ops.get_default_graph().capture_call_time_value(
-          lambda: value,
-          tensor_spec.TensorSpec(shape=(1,), dtype=dtypes.float32))
+          lambda: value, _SPEC_F32_VECTOR1)
       if bool_captured_tensor:
         return deferred_tensor
       else:
@@ -4653,13 +4687,13 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
       concrete_fn.replace_capture_with_deferred_capture(
           bool_captured_tensor,
           float_closure,
-          spec=tensor_spec.TensorSpec(shape=(1,), dtype=dtypes.float32))
+          spec=_SPEC_F32_VECTOR1)
 
     # Test replace without a placeholder
     concrete_fn.replace_capture_with_deferred_capture(
         bool_captured_tensor,
         bool_closure,
-        spec=tensor_spec.TensorSpec(shape=(), dtype=dtypes.bool))
+        spec=_SPEC_BOOL_SCALAR)
 
     self.assertAllEqual(concrete_fn(), [5.])
 
@@ -4670,8 +4704,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def fn():
       deferred_tensor = ops.get_default_graph().capture_call_time_value(
-          lambda: value,
-          tensor_spec.TensorSpec(shape=(1,), dtype=dtypes.float32))
+          lambda: value, _SPEC_F32_VECTOR1)
       return deferred_tensor + captured_tensor
 
     cf = fn.get_concrete_function()
@@ -4693,8 +4726,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def fn():
       deferred_tensor = ops.get_default_graph().capture_call_time_value(
-          lambda: value,
-          tensor_spec.TensorSpec(shape=(1,), dtype=dtypes.float32))
+          lambda: value, _SPEC_F32_VECTOR1)
       if bool_captured_tensor:
         return deferred_tensor
       else:
@@ -4711,7 +4743,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     concrete_fn.graph.replace_capture_with_deferred_capture(
         concrete_fn.captured_inputs[0],
         closure,
-        spec=tensor_spec.TensorSpec(shape=(), dtype=dtypes.bool),
+        spec=_SPEC_BOOL_SCALAR,
         placeholder=concrete_fn.inputs[1])
 
     concrete_fn.set_external_captures([
@@ -4726,7 +4758,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def lazy_capture(x):
       y = ops.get_default_graph().capture_call_time_value(
-          lambda: value, tensor_spec.TensorSpec(None))
+          lambda: value, _SPEC_F32_UNKNOWN)
       return x + y
 
     self.assertAllEqual(lazy_capture(2.0), 3.0)
@@ -4741,7 +4773,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def inner(x):
       y = ops.get_default_graph().capture_call_time_value(
-          lambda: value, tensor_spec.TensorSpec(None))
+          lambda: value, _SPEC_F32_UNKNOWN)
       return x + y
 
     @polymorphic_function.function
@@ -4761,7 +4793,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def inner(x):
       y = ops.get_default_graph().capture_call_time_value(
-          lambda: value, tensor_spec.TensorSpec(None))
+          lambda: value, _SPEC_F32_UNKNOWN)
       return x + y
 
     @polymorphic_function.function
@@ -4790,15 +4822,15 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def lazy_capture(x):
       w = ops.get_default_graph().capture_call_time_value(
-          lambda: value0, tensor_spec.TensorSpec(None), key=0)
+          lambda: value0, _SPEC_F32_UNKNOWN, key=0)
       y = ops.get_default_graph().capture_call_time_value(
-          lambda: value1, tensor_spec.TensorSpec(None), key=1)
+          lambda: value1, _SPEC_F32_UNKNOWN, key=1)
 
       def bad_closure():
         raise ValueError('Should not run')
 
       z = ops.get_default_graph().capture_call_time_value(
-          bad_closure, tensor_spec.TensorSpec(None), key=1)
+          bad_closure, _SPEC_F32_UNKNOWN, key=1)
       return x + y + w + z
 
     self.assertAllEqual(lazy_capture(2.0), 7.0)
@@ -4828,10 +4860,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
       lazy_capture(2.0)
 
   def testDeferredCaptureReturnNestWithCompositeTensor(self):
-    i_s = indexed_slices.IndexedSlices(
-        constant_op.constant([1, 2]),
-        constant_op.constant([0, 1], dtype=dtypes.int64),
-        constant_op.constant([2]))
+    i_s = _example_int64_indexed_slices(with_dense_shape=True)
     r_t = ragged_factory_ops.constant([[[1, 2], [3]], [[4, 5, 6]]])
     s_t = sparse_tensor.SparseTensor(
         values=[1, 2, 3], indices=[[0], [8], [10]], dense_shape=[20])
@@ -4839,11 +4868,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     @polymorphic_function.function
     def lazy_capture():
       y = ops.get_default_graph().capture_call_time_value(
-          lambda: {'i': i_s, 't': (r_t, s_t)},
-          {'i': indexed_slices.IndexedSlicesSpec(
-              dtype=dtypes.int32, dense_shape_dtype=dtypes.int32),
-           't': (ragged_tensor.RaggedTensorSpec([2, None, None], dtypes.int32),
-                 sparse_tensor.SparseTensorSpec([None], dtypes.int32))})
+          lambda: {'i': i_s, 't': (r_t, s_t)}, _SPEC_NEST_WITH_COMPOSITES)
       return y['i'], y['t']
 
     i, (r, s) = lazy_capture()
@@ -4856,9 +4881,7 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     self.assertAllEqual(s_t.dense_shape, s.dense_shape)
 
   def testDeferredCaptureCompositeTensorSpecTypeMismatch(self):
-    value = indexed_slices.IndexedSlices(
-        constant_op.constant([1, 2]),
-        constant_op.constant([0, 1], dtype=dtypes.int64))
+    value = _example_int64_indexed_slices(with_dense_shape=False)
 
     @polymorphic_function.function
     def lazy_capture():
@@ -4869,16 +4892,12 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
     lazy_capture()
 
     # Extra dense shape component.
-    value = indexed_slices.IndexedSlices(
-        constant_op.constant([1, 2]),
-        constant_op.constant([0, 1], dtype=dtypes.int64),
-        constant_op.constant([2]))
+    value = _example_int64_indexed_slices(with_dense_shape=True)
     with self.assertRaises(ValueError):
       lazy_capture()
 
     # Index dtype mismatch int32 vs. int64.
-    value = indexed_slices.IndexedSlices(
-        constant_op.constant([1, 2]), constant_op.constant([0, 1]))
+    value = _example_indexed_slices(with_dense_shape=False)
     with self.assertRaises(ValueError):
       lazy_capture()
 
@@ -4901,24 +4920,20 @@ class MultiDeviceTest(test.TestCase, parameterized.TestCase):
 
     out = f()
     # tf.function output should have same structure/values with the side input
-    self.assertEqual(x['tensor'].numpy(), out['tensor'].numpy())
-    self.assertEqual(x['list'][0].numpy(), out['list'][0].numpy())
-    self.assertEqual(x['list'][1], out['list'][1].numpy())
-    self.assertEqual(x['dict']['float'].numpy(), out['dict']['float'].numpy())
+    nest.assert_same_structure(x, out)
+    self.assertAllEqual(nest.flatten(x), nest.flatten(out))
 
   def testMaybeCreateCapturePlaceholderWithInvalidCapture(self):
-
-    @polymorphic_function.function
-    def f():
-      func = lambda: x
-      # TODO(b/263520817): Remove access to private attribute.
-      return ops.get_default_graph(
-          )._function_captures._create_capture_placeholder(func)
+    # The error is raised before any placeholder is created, so a bare
+    # FuncGraph is enough and nothing needs to be traced.
+    graph = func_graph.FuncGraph('f')
+    func = lambda: x
 
     # Set is not supported
     x = set([1, 2])
     with self.assertRaises(NotImplementedError):
-      f()
+      # TODO(b/263520817): Remove access to private attribute.
+      graph._function_captures._create_capture_placeholder(func)
 
   @parameterized.parameters(
       (1, int, 2, int, 2),
@@ -100,7 +100,7 @@ def parse_message(message):
   func_tags = []
   node_tags = []
   pos = 0
-  for match in re.finditer(_INTERPOLATION_PATTERN, message):
+  for match in _INTERPOLATION_PATTERN.finditer(message):
     parsed_tag = _ParseTag(match.group("type"), match.group("name"))
     if parsed_tag.type == "function_node":
       error_message.append(match.group("sep"))
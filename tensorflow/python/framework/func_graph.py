@@ -15,12 +15,11 @@
 """FuncGraph and related functionality."""
 
 import collections as py_collections
+import operator
 import traceback
 from typing import Any, Callable, Hashable
 import weakref
 
-import numpy as np
-
 from tensorflow.core.framework import attr_value_pb2
 from tensorflow.core.function import trace_type
 from tensorflow.core.function.capture import capture_container
@@ -707,7 +706,7 @@ class FuncGraph(ops.Graph):
 
       # Small EagerTensors are captured with Const ops
       if (tensor.dtype in dtypes.TF_VALUE_DTYPES and
-          np.prod(tensor.shape) <= _EAGER_CONST_THRESHOLD):
+          tensor.shape.num_elements() <= _EAGER_CONST_THRESHOLD):
         return self.capture_eager_tensor(tensor, name)
 
       # Large EagerTensors and resources are captured with Placeholder ops
@@ -1253,13 +1252,11 @@ def has_mutation(n1, n2):
   except ValueError:
     return True
 
-  for arg1, arg2 in zip(
-      nest.flatten(n1, expand_composites=True),
-      nest.flatten(n2, expand_composites=True)):
-    if arg1 is not arg2:
-      return True
-
-  return False
+  # The structures match, so the flattened leaves line up one to one; compare
+  # them pairwise without a Python-level loop.
+  return any(
+      map(operator.is_not, nest.flatten(n1, expand_composites=True),
+          nest.flatten(n2, expand_composites=True)))
 
 
 def check_func_mutation(old_args, old_kwargs, new_args, new_kwargs, func):
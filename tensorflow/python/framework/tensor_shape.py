@@ -1209,6 +1209,11 @@ class TensorShape(trace.TraceType, trace_type.Serializable):
     if not isinstance(other, TensorShape):
       return False
 
+    # Identical shapes are decided by a single tuple comparison instead of a
+    # per-dimension loop.
+    if self._dims == other._dims:  # pylint: disable=protected-access
+      return True
+
     # All Tensors are subtypes of a Tensor with no shape.
     if other.rank is None:
       return True